@@ -1,11 +1,13 @@
+import asyncio
 import os
 import pty
-import re
 import termios
-import threading
-import time
 from pathlib import Path
 
+# Deletion table for bytes.translate: strips ASCII control characters
+# (0x00-0x1F, 0x7F) except CR/LF, which bytes.strip() removes at the edges.
+_CTRL_BYTES = bytes(list(range(0x20)) + [0x7F]).replace(b"\r", b"").replace(b"\n", b"")
+
 
 class PicoSim:
     TERMINATOR = b"\r"
@@ -21,49 +23,69 @@ class PicoSim:
 
         print(f"[PicoSim-{id}] Created virtual serial port: {self.slave_name}")
 
-    def start(self):
-        """Start simulation thread."""
-        t = threading.Thread(target=self.run, daemon=True)
-        t.start()
-
-    def run(self):
-        """Main loop simulating the Pico REPL."""
-        while True:
-            data = os.read(self.master, 1024)
-            if not data:
-                break
-            text = data.decode().strip()
-            if not text or text in ("\r", "\n", "\r\n"):
-                continue
-            text = re.sub(r"[\x00-\x1F\x7F]+", "", text).strip()
-            if text:
-                response = self.handle_command(text)
-                os.write(self.master, (response + "\r ").encode())
+    def register(self, loop: asyncio.AbstractEventLoop):
+        """Register this simulator's PTY on the shared event loop."""
+        loop.add_reader(self.master, self._on_readable, loop)
+
+    def _on_readable(self, loop: asyncio.AbstractEventLoop):
+        """Handle one readable event simulating the Pico REPL."""
+        data = os.read(self.master, 1024)
+        if not data:
+            loop.remove_reader(self.master)
+            return
+        # Sanitize at the bytes level; only the command itself is decoded.
+        clean = data.translate(None, _CTRL_BYTES).strip()
+        if not clean:
+            return
+        text = clean.decode("ascii", "replace")
+        response = self.handle_command(text)
+        os.write(self.master, (response + "\r").encode("ascii"))
+
+    def _handle_print(self, arg: str) -> str:
+        try:
+            val = eval(arg)
+            return str(val)
+        except Exception as e:
+            return f"Error: {e}"
+
+    def _handle_turn_on_pin(self, pin: str) -> str:
+        return f"PicoSim {self.id}: turned ON pin {pin}"
+
+    def _handle_turn_off_pin(self, pin: str) -> str:
+        return f"PicoSim {self.id}: turned OFF pin {pin}"
+
+    def _handle_set_pins(self, mask: str) -> str:
+        try:
+            value = int(mask, 0)
+        except ValueError:
+            return f"Error: invalid pin mask '{mask}'"
+        return f"OK {value:02x}"
+
+    # Dispatch tables: exact commands map straight to their canned reply,
+    # prefixed commands are scanned once and passed their stripped argument.
+    _EXACT = {
+        "help()": "PicoSim help: try print('hi') or 1+1",
+        "?": "PicoSim help: try print('hi') or 1+1",
+        "1+1": "2",
+        "machine.freq()": "125000000",
+        "ping()": "pong",
+    }
+    _PREFIX = (
+        ("print(", _handle_print),
+        ("turn_on_pin(", _handle_turn_on_pin),
+        ("turn_off_pin(", _handle_turn_off_pin),
+        ("set_pins(", _handle_set_pins),
+    )
 
     def handle_command(self, text: str) -> str:
         """Mock a simple MicroPython interpreter."""
-        if text.lower() in ("help()", "?"):
-            return "PicoSim help: try print('hi') or 1+1"
-        elif text.startswith("print("):
-            try:
-                val = eval(text[6:-1])
-                return str(val)
-            except Exception as e:
-                return f"Error: {e}"
-        elif text == "1+1":
-            return "2"
-        elif text == "machine.freq()":
-            return "125000000"
-        elif text == "ping()":
-            return "pong"
-        elif text.startswith("turn_on_pin("):
-            pin = text[len("turn_on_pin(") : -1]
-            return f"PicoSim {self.id}: turned ON pin {pin}"
-        elif text.startswith("turn_off_pin("):
-            pin = text[len("turn_off_pin(") : -1]
-            return f"PicoSim {self.id}: turned OFF pin {pin}"
-        else:
-            return f"PicoSim {self.id}: received '{text}'"
+        reply = self._EXACT.get(text.lower())
+        if reply is not None:
+            return reply
+        for prefix, handler in self._PREFIX:
+            if text.startswith(prefix):
+                return handler(self, text[len(prefix) : -1])
+        return f"PicoSim {self.id}: received '{text}'"
 
 
 def write_env_file(simulators: list[PicoSim], filepath="/workspace/pico_sim.env"):
@@ -75,11 +97,12 @@ def write_env_file(simulators: list[PicoSim], filepath="/workspace/pico_sim.env"
     print(filepath.read_text())
 
 
-def main():
+async def main_async():
     num_picos = int(os.getenv("NUM_PICOS", "2"))
     sims = [PicoSim(i + 1) for i in range(num_picos)]
+    loop = asyncio.get_running_loop()
     for sim in sims:
-        sim.start()
+        sim.register(loop)
 
     write_env_file(sims)
 
@@ -88,8 +111,11 @@ def main():
     for sim in sims:
         print(f"  -> {sim.slave_name}")
 
-    while True:
-        time.sleep(1)
+    await asyncio.Event().wait()  # block until the process is signalled
+
+
+def main():
+    asyncio.run(main_async())
 
 
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+import asyncio
+
 from controllers.talker import Talker
 from core.config import app_settings
 from core.logging_config import setup_logger
@@ -11,24 +13,48 @@ class PicoController:
     Provides methods to turn pins on/off and manage their states.
     """
 
-    def __init__(self):
+    def __init__(self, talker1: Talker, talker2: Talker):
         """
         Initialize the PicoController with two Talker instances.
 
         :param self: Instance of the PicoController class
+        :param talker1: Connected Talker for the first Pico
+        :type talker1: Talker
+        :param talker2: Connected Talker for the second Pico
+        :type talker2: Talker
         """
-        self.talker1 = Talker(app_settings.PICO1_PATH, id=1)
-        self.talker2 = Talker(app_settings.PICO2_PATH, id=2)
+        self.talker1 = talker1
+        self.talker2 = talker2
         self.talkers = {
             self.talker1.get_id(): self.talker1,
             self.talker2.get_id(): self.talker2,
         }
-        self.pin_states: dict[int, dict[int, bool]] = {
-            self.talker1.get_id(): {pin: False for pin in range(1, 9)},
-            self.talker2.get_id(): {pin: False for pin in range(1, 9)},
+        # Pre-encoded single-pin command payloads: only 16 possible messages.
+        self._cmds: dict[tuple[str, int], bytes] = {
+            **{("on", pin): f"turn_on_pin({pin})\r\f".encode() for pin in range(1, 9)},
+            **{
+                ("off", pin): f"turn_off_pin({pin})\r\f".encode() for pin in range(1, 9)
+            },
+        }
+        # One bitmask per talker: bit (pin - 1) is set when the pin is ON.
+        self.pin_states: dict[int, int] = {
+            self.talker1.get_id(): 0,
+            self.talker2.get_id(): 0,
         }
         logger.info("PicoController initialized with two Talker instances.")
 
+    @classmethod
+    async def create(cls) -> "PicoController":
+        """
+        Connect both Talker instances and return a ready PicoController.
+
+        :return: Connected PicoController instance
+        :rtype: PicoController
+        """
+        talker1 = await Talker.create(app_settings.PICO1_PATH, id=1)
+        talker2 = await Talker.create(app_settings.PICO2_PATH, id=2)
+        return cls(talker1, talker2)
+
     async def turn_on_pin(self, talker_id: int, pin: int):
         """
         Turn on a specific pin on a specific talker.
@@ -40,8 +66,8 @@ class PicoController:
         :type pin: int
         """
         try:
-            response = self.talkers[talker_id].send_to_pico(f"turn_on_pin({pin})")
-            self.pin_states[talker_id][pin] = True
+            response = await self.talkers[talker_id].send_bytes(self._cmds[("on", pin)])
+            self.pin_states[talker_id] |= 1 << (pin - 1)
             logger.info(
                 f"Turned ON pin {pin} on talker {talker_id}. Response: {response}"
             )
@@ -60,8 +86,10 @@ class PicoController:
         :type pin: int
         """
         try:
-            response = self.talkers[talker_id].send_to_pico(f"turn_off_pin({pin})")
-            self.pin_states[talker_id][pin] = False
+            response = await self.talkers[talker_id].send_bytes(
+                self._cmds[("off", pin)]
+            )
+            self.pin_states[talker_id] &= ~(1 << (pin - 1))
             logger.info(
                 f"Turned OFF pin {pin} on talker {talker_id}. Response: {response}"
             )
@@ -69,7 +97,7 @@ class PicoController:
             logger.error(f"Error turning OFF pin {pin} on talker {talker_id}: {e}")
             raise
 
-    async def get_pin_state(self, talker_id: int, pin: int) -> bool:
+    def get_pin_state(self, talker_id: int, pin: int) -> bool:
         """
         Get the current state of a specific pin on a specific talker.
 
@@ -81,7 +109,7 @@ class PicoController:
         :return: Current state of the pin (True for ON, False for OFF)
         :rtype: bool
         """
-        return self.pin_states.get((talker_id, pin), False)
+        return bool(self.pin_states[talker_id] & (1 << (pin - 1)))
 
     async def turn_on_all_pins(self, talker_id: int):
         """
@@ -91,10 +119,17 @@ class PicoController:
         :param talker_id: ID of the Talker instance
         :type talker_id: int
         """
-        for pin in range(1, 9):
-            if not await self.get_pin_state(talker_id, pin):
-                await self.turn_on_pin(talker_id, pin)
-        logger.info(f"Turned ON all pins on talker {talker_id}.")
+        if self.pin_states[talker_id] == 0xFF:
+            return  # All pins already ON
+        try:
+            response = await self.talkers[talker_id].send_to_pico("set_pins(0xFF)")
+            self.pin_states[talker_id] = 0xFF
+            logger.info(
+                f"Turned ON all pins on talker {talker_id}. Response: {response}"
+            )
+        except Exception as e:
+            logger.error(f"Error turning ON all pins on talker {talker_id}: {e}")
+            raise
 
     async def turn_off_all_pins(self, talker_id: int):
         """
@@ -104,10 +139,30 @@ class PicoController:
         :param talker_id: ID of the Talker instance
         :type talker_id: int
         """
-        for pin in range(1, 9):
-            if await self.get_pin_state(talker_id, pin):
-                await self.turn_off_pin(talker_id, pin)
-        logger.info(f"Turned OFF all pins on talker {talker_id}.")
+        if self.pin_states[talker_id] == 0x00:
+            return  # All pins already OFF
+        try:
+            response = await self.talkers[talker_id].send_to_pico("set_pins(0x00)")
+            self.pin_states[talker_id] = 0x00
+            logger.info(
+                f"Turned OFF all pins on talker {talker_id}. Response: {response}"
+            )
+        except Exception as e:
+            logger.error(f"Error turning OFF all pins on talker {talker_id}: {e}")
+            raise
+
+    async def _clean_up_talker(self, talker_id: int, talker: Talker):
+        """
+        Turn off all pins on one talker and close its serial connection.
+
+        :param self: Instance of the PicoController class
+        :param talker_id: ID of the Talker instance
+        :type talker_id: int
+        :param talker: Talker instance to clean up
+        :type talker: Talker
+        """
+        await self.turn_off_all_pins(talker_id)
+        talker.close_connection()
 
     async def clean_up(self):
         """
@@ -118,7 +173,10 @@ class PicoController:
         logger.info(
             "Cleaning up PicoController: turning off all pins and closing connections."
         )
-        for id, talker in self.talkers.items():
-            await self.turn_off_all_pins(id)
-            talker.close_connection()
+        await asyncio.gather(
+            *(
+                self._clean_up_talker(talker_id, talker)
+                for talker_id, talker in self.talkers.items()
+            )
+        )
         logger.info("Closed all Talker serial connections.")
@@ -1,32 +1,69 @@
-import serial
+import asyncio
+import logging
+
+import serial_asyncio
 
 from core.logging_config import setup_logger
 
 logger = setup_logger()
 
+# Upper bound for a single Pico reply; a malformed frame can never grow past it.
+READ_LIMIT = 256
 
-class Talker:
-    TERMINATOR = "\r".encode("UTF8")
 
-    def __init__(self, name: str, id: int, timeout: int = 1):
+class Talker:
+    TERMINATOR = "\r".encode("ascii")
+
+    def __init__(
+        self,
+        name: str,
+        id: int,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        timeout: int = 1,
+    ):
         """
         Initialize Talker object.
 
         :param self: Instance of the Talker class
         :param name: Name of the serial port
         :type name: str
+        :param reader: Stream reader for the serial port
+        :type reader: asyncio.StreamReader
+        :param writer: Stream writer for the serial port
+        :type writer: asyncio.StreamWriter
         :param timeout: Timeout for serial communication in seconds, defaults to 1
         :type timeout: int
         """
         self.name = name
         self.id = id
-        self.serial = serial.Serial(name, 115200, timeout=timeout)
-        logger.info(f"[Talker {self.id}] Serial connection opened on {name}")
-        self.verify_connection()
+        self.timeout = timeout
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def create(cls, name: str, id: int, timeout: int = 1) -> "Talker":
+        """
+        Open the serial connection and return a verified Talker instance.
+
+        :param name: Name of the serial port
+        :type name: str
+        :param timeout: Timeout for serial communication in seconds, defaults to 1
+        :type timeout: int
+        :return: Connected Talker instance
+        :rtype: Talker
+        """
+        reader, writer = await serial_asyncio.open_serial_connection(
+            url=name, baudrate=115200, limit=READ_LIMIT
+        )
+        talker = cls(name, id, reader, writer, timeout)
+        logger.info(f"[Talker {id}] Serial connection opened on {name}")
+        await talker.verify_connection()
         # TODO: Add error handling for serial connection
         # TODO: user input for successful connection
+        return talker
 
-    def verify_connection(self) -> bool:
+    async def verify_connection(self) -> bool:
         """
         Verify the connection to the Pico device is stable.
 
@@ -35,10 +72,13 @@ class Talker:
         :rtype: bool
         """
         try:
-            self.serial.reset_input_buffer()
-            self.serial.reset_output_buffer()
+            # The port was just opened, so the buffers are normally empty;
+            # only flush stale input if something is actually waiting.
+            ser = self.writer.transport.serial
+            if ser.in_waiting:
+                ser.reset_input_buffer()
 
-            response = self.send_to_pico("ping()")
+            response = await self.send_to_pico("ping()")
 
             if response:
                 logger.info(
@@ -54,7 +94,7 @@ class Talker:
             logger.error(f"[Talker {self.id}] Connection verification failed: {e}")
             return False
 
-    def send_to_pico(self, text: str) -> str:
+    async def send_to_pico(self, text: str) -> str:
         """
         Send a line of text to the Pico device.
 
@@ -65,15 +105,26 @@ class Talker:
         :rtype: str
         """
         line = "%s\r\f" % text
-        self.serial.write(line.encode("utf-8"))
-        reply = self.receive_from_pico()
-        reply = reply.replace(
-            ">>> ", ""
-        )  # lines after first will be prefixed by a propmt
-        logger.debug(f"[Talker {self.id}] Sent: {text} | Received: {reply}")
+        return await self.send_bytes(line.encode("ascii"))
+
+    async def send_bytes(self, payload: bytes) -> str:
+        """
+        Send a pre-encoded command payload to the Pico device.
+
+        :param self: Instance of the Talker class
+        :param payload: Pre-encoded command bytes, including the terminator
+        :type payload: bytes
+        :return: Reply from the Pico device
+        :rtype: str
+        """
+        self.writer.write(payload)
+        await self.writer.drain()
+        reply = await self.receive_from_pico()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[Talker %s] Sent: %r | Received: %s", self.id, payload, reply)
         return reply
 
-    def receive_from_pico(self) -> str:
+    async def receive_from_pico(self) -> str:
         """
         Receive a line of text from the Pico device.
 
@@ -81,8 +132,18 @@ class Talker:
         :return: Received text from the Pico device
         :rtype: str
         """
-        line = self.serial.read_until(self.TERMINATOR)
-        return line.decode("UTF8").strip() + " " + self.name
+        try:
+            line = await asyncio.wait_for(
+                self.reader.readuntil(self.TERMINATOR), timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"[Talker {self.id}] Timed out waiting for reply")
+            return ""
+        except (asyncio.LimitOverrunError, asyncio.IncompleteReadError) as e:
+            logger.warning(f"[Talker {self.id}] Malformed reply frame: {e}")
+            return ""
+        # The Pico REPL only emits ASCII; the ascii codec is the fast path.
+        return line.decode("ascii", "replace").strip()
 
     def close_connection(self) -> None:
         """
@@ -91,7 +152,7 @@ class Talker:
         :param self: Instance of the Talker class
         """
         logger.info(f"[Talker {self.id}] Closing serial connection on {self.name}")
-        self.serial.close()
+        self.writer.close()
 
     def get_id(self) -> int:
         """
@@ -1,6 +1,3 @@
-from pathlib import Path
-
-from dotenv import dotenv_values
 from pydantic_settings import BaseSettings
 
 
@@ -18,13 +15,8 @@ class Settings(BaseSettings):
     CAR_CHARGE_THRESHOLD_C: float = 8.0
 
     class Config:
-        env_file = ".env"
+        # Later files win, so the simulator's PICO*_PATH mapping overrides .env.
+        env_file = (".env", "/workspace/pico_sim.env")
 
 
 app_settings = Settings()
-
-PICO_ENV_PATH = Path("/workspace/pico_sim.env")
-if PICO_ENV_PATH.exists():
-    pico_env = dotenv_values(PICO_ENV_PATH)
-    app_settings.PICO1_PATH = pico_env.get("PICO1_PATH", app_settings.PICO1_PATH)
-    app_settings.PICO2_PATH = pico_env.get("PICO2_PATH", app_settings.PICO2_PATH)
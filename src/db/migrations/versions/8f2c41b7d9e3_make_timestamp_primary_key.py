@@ -0,0 +1,41 @@
+"""Make timestamp the primary key of electricity_prices
+
+Revision ID: 8f2c41b7d9e3
+Revises: de759c839ada
+Create Date: 2025-11-20 18:12:07.513284
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f2c41b7d9e3"
+down_revision: Union[str, Sequence[str], None] = "de759c839ada"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_column("electricity_prices", "id")
+    op.create_primary_key("pk_electricity_prices", "electricity_prices", ["timestamp"])
+    # The primary key index supersedes the separate timestamp index.
+    op.drop_index("ix_electricity_prices_timestamp", table_name="electricity_prices")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_electricity_prices_timestamp", "electricity_prices", ["timestamp"]
+    )
+    op.drop_constraint("pk_electricity_prices", "electricity_prices", type_="primary")
+    # add_column ignores primary_key/autoincrement, so recreate the identity
+    # column and the primary key constraint explicitly.
+    op.add_column(
+        "electricity_prices",
+        sa.Column("id", sa.Integer(), sa.Identity(), nullable=False),
+    )
+    op.create_primary_key("electricity_prices_pkey", "electricity_prices", ["id"])
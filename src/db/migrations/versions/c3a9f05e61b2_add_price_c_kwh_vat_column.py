@@ -0,0 +1,45 @@
+"""Add precomputed VAT-inclusive cents-per-kWh column
+
+Revision ID: c3a9f05e61b2
+Revises: 8f2c41b7d9e3
+Create Date: 2025-11-21 09:41:33.208146
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from core.config import app_settings
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a9f05e61b2"
+down_revision: Union[str, Sequence[str], None] = "8f2c41b7d9e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "electricity_prices",
+        sa.Column("price_c_kwh_vat", sa.Float(), nullable=True),
+    )
+    # Backfill existing rows with the same conversion the save path applies:
+    # EUR/MWh -> cents/kWh including VAT (/1000 * 100 folds to * 0.1). The
+    # configured VAT rate is read here directly so the migration does not
+    # depend on app helper internals.
+    factor = (1 + app_settings.FINNISH_VAT_PERCENTAGE / 100) * 0.1
+    op.execute(
+        sa.text(
+            "UPDATE electricity_prices "
+            "SET price_c_kwh_vat = ROUND(CAST(price_amount_mwh_eur * :factor AS numeric), 2)"
+        ).bindparams(factor=factor)
+    )
+    op.alter_column("electricity_prices", "price_c_kwh_vat", nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("electricity_prices", "price_c_kwh_vat")
@@ -6,6 +6,8 @@ from sqlmodel import Field, SQLModel
 class ElectricityPrices(SQLModel, table=True):
     __tablename__ = "electricity_prices"
 
-    id: int | None = Field(default=None, primary_key=True)
+    timestamp: datetime = Field(primary_key=True)
     price_amount_mwh_eur: float = Field(index=True, nullable=False)
-    timestamp: datetime = Field(index=True, nullable=False)
+    # VAT-inclusive cents/kWh, precomputed at save time so the hot read
+    # path is a plain column fetch.
+    price_c_kwh_vat: float = Field(nullable=False)
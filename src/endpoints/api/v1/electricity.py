@@ -3,11 +3,8 @@ from fastapi import APIRouter, Depends, Request
 from sqlmodel import Session
 
 from db.base import get_session
-from models.electricity_price_models import ElectricityPriceResponse
-from services.electricity_prices import (
-    get_electricity_prices,
-    save_electricity_prices_to_db,
-)
+from models.electricity_price_models import PriceSeries
+from services.electricity_prices import fetch_and_save_electricity_prices
 
 electricity_router = APIRouter(
     prefix="/electricity",
@@ -17,7 +14,7 @@ electricity_router = APIRouter(
 @electricity_router.get("/prices")
 async def fetch_and_save_prices(
     req: Request, session: Session = Depends(get_session)
-) -> ElectricityPriceResponse:
+) -> list[PriceSeries]:
     """
     Fetch electricity prices from external API and save them to the database.
 
@@ -25,10 +22,8 @@ async def fetch_and_save_prices(
     :type req: Request
     :param session: Database session
     :type session: Session
-    :return: Electricity prices response
-    :rtype: ElectricityPriceResponse
+    :return: Parsed electricity price series
+    :rtype: list[PriceSeries]
     """
     client: httpx.AsyncClient = req.app.state.http_client
-    prices = await get_electricity_prices(client)
-    save_electricity_prices_to_db(prices, session)
-    return prices
+    return await fetch_and_save_electricity_prices(client, session)
@@ -5,27 +5,35 @@ from core.logging_config import setup_logger
 
 logger = setup_logger()
 
+_TZ = ZoneInfo("Europe/Helsinki")
 
-def get_current_point_index() -> int:
+
+def get_current_point_index(now: datetime | None = None) -> int:
     """
     Get the current point index based on the current time in Helsinki timezone.
 
+    :param now: Current time to index; read from the clock when omitted
+    :type now: datetime | None
     :return: Current point index (1-96)
     :rtype: int
     """
-    now = datetime.now(tz=ZoneInfo("Europe/Helsinki"))
-    logger.debug(f"Current time: {now}")
+    if now is None:
+        now = datetime.now(tz=_TZ)
+    logger.debug("Current time: %s", now)
     return now.hour * 4 + (now.minute // 15) + 1
 
 
-def get_current_quarter_timestamp() -> datetime:
+def get_current_quarter_timestamp(now: datetime | None = None) -> datetime:
     """
     Get the timestamp of the current quarter-hour in Helsinki timezone.
 
+    :param now: Current time to round down; read from the clock when omitted
+    :type now: datetime | None
     :return: Timestamp rounded down to the nearest quarter-hour
     :rtype: datetime
     """
-    now = datetime.now(tz=ZoneInfo("Europe/Helsinki"))
+    if now is None:
+        now = datetime.now(tz=_TZ)
     quarter_hour = (now.minute // 15) * 15
     quarter_timestamp = now.replace(minute=quarter_hour, second=0, microsecond=0)
     return quarter_timestamp
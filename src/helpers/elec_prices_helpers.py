@@ -3,6 +3,12 @@ from zoneinfo import ZoneInfo
 
 from core.config import app_settings
 
+HELSINKI_TZ = ZoneInfo("Europe/Helsinki")
+
+# EUR/MWh -> cents/kWh including VAT, folded into a single multiplier
+# (/1000 for MWh->kWh and *100 for EUR->cents combine to *0.1).
+_VAT_C_PER_KWH_FACTOR = (1 + app_settings.FINNISH_VAT_PERCENTAGE / 100) * 0.1
+
 
 def get_today_and_tomorrow_dates() -> tuple[str, str]:
     """
@@ -11,10 +17,9 @@ def get_today_and_tomorrow_dates() -> tuple[str, str]:
     :return: Tuple containing today's and tomorrow's dates as strings in YYYYMMDD format
     :rtype: tuple[str, str]
     """
-    today = datetime.now(tz=ZoneInfo("Europe/Helsinki")).strftime("%Y%m%d")
-    tomorrow = datetime.now(tz=ZoneInfo("Europe/Helsinki")) + timedelta(days=1)
-    tomorrow = tomorrow.strftime("%Y%m%d")
-    return today, tomorrow
+    today_d = datetime.now(tz=HELSINKI_TZ).date()
+    tomorrow_d = today_d + timedelta(days=1)
+    return f"{today_d:%Y%m%d}", f"{tomorrow_d:%Y%m%d}"
 
 
 def position_to_timestamp(position: int, day: str) -> datetime:
@@ -29,8 +34,10 @@ def position_to_timestamp(position: int, day: str) -> datetime:
     :return: The corresponding timestamp.
     :rtype: datetime
     """
-    helsinki_tz = ZoneInfo("Europe/Helsinki")
-    target_date = datetime.strptime(day, "%Y%m%d").replace(tzinfo=helsinki_tz)
+    # The day string has a fixed YYYYMMDD layout, so slicing beats strptime.
+    target_date = datetime(
+        int(day[:4]), int(day[4:6]), int(day[6:8]), tzinfo=HELSINKI_TZ
+    )
 
     # Each position represents a 15 minute block starting from 01:00.
     minutes_from_start = 60 + (position - 1) * 15
@@ -50,7 +57,19 @@ def calculate_c_per_kwh(price_e_per_mwh: float) -> float:
     :return: Electricity price in cents per kilowatt-hour including VAT
     :rtype: float
     """
-    eur_per_kwh = price_e_per_mwh / 1000.0
-    eur_per_kwh_vat = eur_per_kwh * (1 + app_settings.FINNISH_VAT_PERCENTAGE / 100)
-    cents_per_kwh_vat = eur_per_kwh_vat * 100.0
-    return cents_per_kwh_vat
+    return price_e_per_mwh * _VAT_C_PER_KWH_FACTOR
+
+
+def calculate_c_per_kwh_batch(prices_e_per_mwh: list[float]) -> list[float]:
+    """
+    Convert a batch of electricity prices to cents per kWh including VAT
+
+    Applies the precomputed VAT/unit multiplier in one pass instead of a
+    per-value function call.
+
+    :param prices_e_per_mwh: Electricity prices in euros per megawatt-hour
+    :type prices_e_per_mwh: list[float]
+    :return: Electricity prices in cents per kilowatt-hour including VAT, in input order
+    :rtype: list[float]
+    """
+    return [price * _VAT_C_PER_KWH_FACTOR for price in prices_e_per_mwh]
@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 import httpx
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from core.config import app_settings
 from core.logging_config import setup_logger
@@ -17,7 +18,14 @@ logger = setup_logger()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    app.state.http_client = httpx.AsyncClient(timeout=60.0)
+    # One long-lived client shared by the app; HTTP/2 with a couple of
+    # keep-alive connections spares the daily price fetch (and any retries)
+    # a fresh TCP+TLS handshake.
+    app.state.http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=2),
+        timeout=60.0,
+    )
     logger.info("HTTP client initialized")
 
     monitor_service = ElectricityMonitorService(app.state.http_client)
@@ -30,7 +38,7 @@ async def lifespan(app: FastAPI):
     await app.state.http_client.aclose()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -43,12 +51,16 @@ app.add_middleware(
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    start = time.time()
+    start = time.perf_counter()
     response: Response = await call_next(request)
-    process_time = (time.time() - start) * 1000
+    process_time = (time.perf_counter() - start) * 1000
 
     logger.info(
-        f"{request.method} {request.url.path} completed_in={process_time:.2f}ms status_code={response.status_code}"
+        "%s %s completed_in=%.2fms status_code=%s",
+        request.method,
+        request.url.path,
+        process_time,
+        response.status_code,
     )
 
     return response
@@ -1,27 +1,30 @@
 import asyncio
-from datetime import datetime
+import logging
+from datetime import datetime, time, timedelta
 from typing import Optional
-from zoneinfo import ZoneInfo
 
 import httpx
 from sqlalchemy.exc import OperationalError
-from sqlmodel import select
+from sqlmodel import Session
 
 from controllers.pico_controller import PicoController
 from core.config import app_settings
 from core.logging_config import setup_logger
-from db.base import get_session
+from db.base import engine
 from db.models import ElectricityPrices
 from helpers.common import get_current_quarter_timestamp
+from helpers.elec_prices_helpers import HELSINKI_TZ
 from models.electricity_monitor_service_status import ElectricityMonitorServiceStatus
 from services.electricity_prices import (
     check_if_tomorrow_prices_exist,
-    get_electricity_prices,
-    save_electricity_prices_to_db,
+    fetch_and_save_electricity_prices,
 )
 
 logger = setup_logger()
 
+# Daily fetch time for the next day's prices, in Helsinki local time.
+_FETCH_TIME = time(14, 0)
+
 
 class ElectricityPriceNotFoundError(Exception):
     """
@@ -34,14 +37,59 @@ class ElectricityMonitorService:
     Service to monitor electricity prices and control Pico pins accordingly.
     """
 
+    # Retry interval when the current price could not be read.
+    ERROR_RETRY_INTERVAL_S = 10
+
     def __init__(
         self,
         client: httpx.AsyncClient,
         pico_controller: Optional[PicoController] = None,
     ):
         self.client = client
-        self.pico_controller = pico_controller or PicoController()
+        self.pico_controller = pico_controller
         self.status = ElectricityMonitorServiceStatus(is_running=False)
+        # Prices keyed by quarter-hour timestamp; saves a DB round-trip when
+        # a quarter is re-checked. Entries older than two hours are evicted
+        # on insert so the dict stays tiny.
+        self._price_cache: dict[datetime, float] = {}
+        # Session reused for the lifetime of the service; opening one per
+        # tick costs a connection checkout and transaction envelope each time.
+        self._session: Session | None = None
+        # Set by stop() to wake sleeping tasks immediately instead of letting
+        # them finish their current sleep before noticing is_running flipped.
+        self._stop_event = asyncio.Event()
+        # Timer for the next 14:00 price fetch; re-armed after each fire and
+        # cancelled by stop().
+        self._fetch_handle: asyncio.TimerHandle | None = None
+
+    def _get_db_session(self) -> Session:
+        """
+        Return the service's long-lived DB session, opening it on first use.
+
+        :param self: Instance of ElectricityMonitorService
+        :return: Database session
+        :rtype: Session
+        """
+        if self._session is None:
+            self._session = Session(engine)
+        return self._session
+
+    def _reset_db_session(self) -> None:
+        """
+        Discard the long-lived session so the next use opens a fresh one.
+
+        Called when an OperationalError suggests the underlying connection
+        has gone stale (e.g. the database restarted).
+
+        :param self: Instance of ElectricityMonitorService
+        """
+        if self._session is None:
+            return
+        try:
+            self._session.close()
+        except Exception as e:
+            logger.debug("Ignoring error while closing stale session: %s", e)
+        self._session = None
 
     async def start(self) -> None:
         """
@@ -49,10 +97,22 @@ class ElectricityMonitorService:
 
         :param self: Instance of ElectricityMonitorService
         """
+        if self.pico_controller is None:
+            self.pico_controller = await PicoController.create()
+        self._stop_event.clear()
         self.status.is_running = True
         logger.info("Electricity monitor service started.")
 
-        await asyncio.gather(self._monitor_prices_task())
+        now = datetime.now(HELSINKI_TZ)
+        if now >= datetime.combine(now.date(), _FETCH_TIME, tzinfo=HELSINKI_TZ):
+            # Started after today's fetch time; catch up right away instead
+            # of deferring the first attempt to tomorrow. The fetch re-arms
+            # the daily timer itself (and skips the fetch if the prices are
+            # already stored).
+            asyncio.create_task(self._run_scheduled_fetch())
+        else:
+            self._schedule_next_fetch()
+        await self._monitor_prices_task()
 
     async def stop(self) -> None:
         """
@@ -60,10 +120,34 @@ class ElectricityMonitorService:
 
         :param self: Instance of ElectricityMonitorService
         """
+        if not self.status.is_running:
+            return  # Already stopped; don't clean up twice
         self.status.is_running = False
+        self._stop_event.set()
+        if self._fetch_handle is not None:
+            self._fetch_handle.cancel()
+            self._fetch_handle = None
         await self.pico_controller.clean_up()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
         logger.info("Electricity monitor service stopped.")
 
+    async def _sleep_or_stop(self, seconds: float) -> bool:
+        """
+        Sleep for up to the given duration, waking early when stop() is called.
+
+        :param seconds: Maximum time to sleep in seconds
+        :type seconds: float
+        :return: True if the service was stopped during the sleep
+        :rtype: bool
+        """
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        except TimeoutError:
+            return False
+        return True
+
     async def _monitor_prices_task(self) -> None:
         """
         Background task to monitor electricity prices and control Pico pins
@@ -71,36 +155,13 @@ class ElectricityMonitorService:
         :param self: Instance of ElectricityMonitorService
         """
         while self.status.is_running:
-            self._new_data_status_check()
-            if not self.status.latest_data_fetched:
-                if self.status.new_data_should_be_available:
-                    try:
-                        gen = get_session()
-                        session = next(gen)
-                        if not check_if_tomorrow_prices_exist(session):
-                            try:
-                                await self._fetch_and_save_prices()
-                                self.status.latest_data_fetched = True
-                                self.status.new_data_should_be_available = False
-                                logger.debug("Fetched and saved tomorrow's prices.")
-                            except httpx.HTTPError as e:
-                                logger.error(f"Failed to fetch prices from API: {e}")
-                            except OperationalError as e:
-                                logger.error(f"Failed to save prices to DB: {e}")
-                            except Exception as e:
-                                logger.error(
-                                    f"Unexpected error while fetching and saving prices: {e}"
-                                )
-                        else:
-                            logger.debug(
-                                "Tomorrow's prices already exist in the database."
-                            )
-                            self.status.latest_data_fetched = True
-                            self.status.new_data_should_be_available = False
-                    finally:
-                        gen.close()
+            # One clock read per iteration; the quarter timestamp derived from
+            # it drives both the price lookup and the boundary sleep below.
+            quarter_ts = get_current_quarter_timestamp()
+            price_found = False
             try:
-                price, timestamp = self._get_current_price_c_per_kwh_vat()
+                price, timestamp = self._get_current_price_c_per_kwh_vat(quarter_ts)
+                price_found = True
                 if price is not None and price != self.status.current_price:
                     logger.info(
                         f"Current electricity price: {price} cents/kWh (including VAT) at {timestamp}"
@@ -123,6 +184,7 @@ class ElectricityMonitorService:
                     logger.error(f"Failed to fetch prices from API: {e}")
                 except OperationalError as e:
                     logger.error(f"Failed to save prices to DB: {e}")
+                    self._reset_db_session()
                 except Exception as e:
                     logger.error(
                         f"Unexpected error while fetching and saving prices: {e}"
@@ -130,8 +192,91 @@ class ElectricityMonitorService:
             except Exception as e:
                 logger.error(f"Unexpected error in monitoring task: {e}")
 
-            logger.debug(f"Monitor status: {self.status}")
-            await asyncio.sleep(10)  # Check every 10 seconds
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Monitor status: %s", self.status)
+            # The price only changes on quarter-hour boundaries; sleep until
+            # just past the next one instead of polling on a fixed interval.
+            # After a failed read, retry on a short interval so a late fetch
+            # is picked up without waiting out the whole quarter.
+            if price_found:
+                next_quarter = quarter_ts + timedelta(minutes=15)
+                sleep_s = (
+                    next_quarter - datetime.now(HELSINKI_TZ)
+                ).total_seconds() + 1  # pad to land safely inside the next quarter
+            else:
+                sleep_s = self.ERROR_RETRY_INTERVAL_S
+            if await self._sleep_or_stop(sleep_s):
+                break
+
+    def _schedule_next_fetch(self) -> None:
+        """
+        Arm a one-shot timer for the next 14:00 Helsinki fetch
+
+        Recomputing the target from the wall clock on every re-arm keeps the
+        timer aligned across DST changes and late event-loop wakeups, without
+        holding a sleeping coroutine alive between fires.
+
+        :param self: Instance of ElectricityMonitorService
+        """
+        now = datetime.now(HELSINKI_TZ)
+        target_time = datetime.combine(now.date(), _FETCH_TIME, tzinfo=HELSINKI_TZ)
+        if now >= target_time:
+            target_time += timedelta(days=1)
+        self._arm_fetch_timer((target_time - now).total_seconds())
+
+    def _arm_fetch_timer(self, delay_s: float) -> None:
+        """
+        Arm the fetch timer, replacing any timer that is already pending
+
+        :param delay_s: Seconds until the fetch should fire
+        :type delay_s: float
+        """
+        if self._fetch_handle is not None:
+            self._fetch_handle.cancel()
+        loop = asyncio.get_running_loop()
+        self._fetch_handle = loop.call_later(
+            delay_s,
+            lambda: asyncio.create_task(self._run_scheduled_fetch()),
+        )
+
+    async def _run_scheduled_fetch(self) -> None:
+        """
+        Fetch the next day's prices when the 14:00 timer fires, then re-arm it
+
+        A failed attempt re-arms on the short retry interval instead of
+        waiting for tomorrow's 14:00, matching the old loop's behavior of
+        retrying until the fetch succeeds.
+
+        :param self: Instance of ElectricityMonitorService
+        """
+        if not self.status.is_running:
+            return
+
+        # A new fetch window has opened; the flag stays False until this
+        # (or a retried) attempt lands tomorrow's prices.
+        self.status.latest_data_fetched = False
+        fetched = False
+        try:
+            if check_if_tomorrow_prices_exist(self._get_db_session()):
+                logger.debug("Tomorrow's prices already exist in the database.")
+                self.status.latest_data_fetched = True
+            else:
+                await self._fetch_and_save_prices()
+                self.status.latest_data_fetched = True
+                logger.debug("Fetched and saved tomorrow's prices.")
+            fetched = True
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to fetch prices from API: {e}")
+        except OperationalError as e:
+            logger.error(f"Failed to save prices to DB: {e}")
+            self._reset_db_session()
+        except Exception as e:
+            logger.error(f"Unexpected error while fetching and saving prices: {e}")
+
+        if fetched:
+            self._schedule_next_fetch()
+        else:
+            self._arm_fetch_timer(self.ERROR_RETRY_INTERVAL_S)
 
     async def _fetch_and_save_prices(self) -> None:
         """
@@ -139,63 +284,61 @@ class ElectricityMonitorService:
 
         :param self: Instance of ElectricityMonitorService
         """
-        prices = await get_electricity_prices(self.client)
-        gen = get_session()
-        session = next(gen)
-        try:
-            save_electricity_prices_to_db(prices, session)
-        finally:
-            # close the generator to exit the session context
-            gen.close()
+        await fetch_and_save_electricity_prices(self.client, self._get_db_session())
 
-    def _get_current_price_c_per_kwh_vat(self) -> tuple[float, datetime]:
+    def _get_current_price_c_per_kwh_vat(
+        self, timestamp: datetime | None = None
+    ) -> tuple[float, datetime]:
         """
         Get the current electricity price in cents per kWh including VAT
 
         :param self: Instance of ElectricityMonitorService
+        :param timestamp: Quarter-hour timestamp to look up; read from the clock when omitted
+        :type timestamp: datetime | None
         :return: Current electricity price in cents per kWh including VAT and the timestamp
         :rtype: tuple[float, datetime]
         """
-        # Acquire a session from the get_session() generator and ensure it is closed
-        try:
-            gen = get_session()
-            session = next(gen)
-        except Exception as e:
-            logger.error(f"Failed to acquire DB session: {e}")
-            raise ElectricityPriceNotFoundError(
-                "Could not acquire database session"
-            ) from e
-
-        timestamp = get_current_quarter_timestamp()
+        if timestamp is None:
+            timestamp = get_current_quarter_timestamp()
+        cached = self._price_cache.get(timestamp)
+        if cached is not None:
+            return cached, timestamp
 
+        session = self._get_db_session()
         try:
-            row = session.exec(
-                select(ElectricityPrices).where(
-                    ElectricityPrices.timestamp == timestamp
-                )
-            ).first()
+            # timestamp is the primary key, so session.get skips query
+            # construction and hits the identity map / PK index directly.
+            row = session.get(ElectricityPrices, timestamp)
+            # Read the value out, then close the implicit read transaction
+            # right away (which expires the row); the long-lived session
+            # would otherwise sit idle-in-transaction until the next save
+            # commits.
+            cents_per_kwh_vat = row.price_c_kwh_vat if row else None
+            session.rollback()
         except OperationalError as oe:
             logger.error(
                 f"Database OperationalError while querying current price: {oe}"
             )
+            # The connection is likely stale; rebuild the session so the
+            # next lookup gets a fresh one.
+            self._reset_db_session()
             raise ElectricityPriceNotFoundError(f"DB error: {oe}") from oe
         except Exception as e:
             logger.error(f"Unexpected error while querying current price: {e}")
             raise ElectricityPriceNotFoundError(f"Unexpected error: {e}") from e
-        finally:
-            try:
-                gen.close()
-            except Exception:
-                pass
 
-        logger.debug(f"Database row for timestamp {timestamp}: {row}")
-
-        if row:
-            eur_per_kwh = row.price_amount_mwh_eur / 1000.0
-            eur_per_kwh_vat = eur_per_kwh * (
-                1 + app_settings.FINNISH_VAT_PERCENTAGE / 100
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Database price for timestamp %s: %s", timestamp, cents_per_kwh_vat
             )
-            cents_per_kwh_vat = round(eur_per_kwh_vat * 100.0, 2)
+
+        if cents_per_kwh_vat is not None:
+            # VAT-inclusive value is precomputed at save time.
+            cutoff = timestamp - timedelta(hours=2)
+            self._price_cache = {
+                ts: price for ts, price in self._price_cache.items() if ts >= cutoff
+            }
+            self._price_cache[timestamp] = cents_per_kwh_vat
             return cents_per_kwh_vat, timestamp
         else:
             logger.warning(f"No electricity price found for timestamp {timestamp}")
@@ -203,23 +346,6 @@ class ElectricityMonitorService:
                 f"No electricity price found for timestamp {timestamp}"
             )
 
-    def _new_data_status_check(self) -> None:
-        """
-        If current time is the first quarter of the day, set latest_data_fetched to False.
-        If current time is after 14:00, set new_data_should_be_available to True.
-        """
-        current_time = datetime.now(ZoneInfo("Europe/Helsinki"))
-        if current_time.hour == 0 and current_time.minute < 15:
-            self.status.latest_data_fetched = False
-            self.status.new_data_should_be_available = False
-
-        if (
-            current_time.hour >= 14
-            and not self.status.latest_data_fetched
-            and not self.status.new_data_should_be_available
-        ):
-            self.status.new_data_should_be_available = True
-
     async def _pico_control_logic(self, price_c: float) -> None:
         """
         Control Pico pins based on the current electricity price
@@ -236,19 +362,18 @@ class ElectricityMonitorService:
         :param self: Instance of ElectricityMonitorService
         :param price_c: Current electricity price in cents per kWh including VAT
         """
-        if price_c < app_settings.CAR_CHARGE_THRESHOLD_C:
-            if self.status.car_charging:
-                return  # Already charging
+        should_charge = price_c < app_settings.CAR_CHARGE_THRESHOLD_C
+        if should_charge is self.status.car_charging:
+            return  # Pin state already matches the threshold side
+
+        if should_charge:
             logger.info(
                 f"Electricity price {price_c} c/kWh is below threshold. Enabling car charging."
             )
             await self.pico_controller.turn_on_all_pins(talker_id=1)
-            self.status.car_charging = True
         else:
-            if not self.status.car_charging:
-                return  # Already not charging
             logger.info(
                 f"Electricity price {price_c} c/kWh is above threshold. Disabling car charging."
             )
             await self.pico_controller.turn_off_all_pins(talker_id=1)
-            self.status.car_charging = False
+        self.status.car_charging = should_charge
@@ -1,30 +1,81 @@
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from datetime import datetime, timedelta
+from io import BytesIO
+from xml.etree.ElementTree import iterparse
 
 import httpx
-import xmltodict
+from sqlalchemy import bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel import Session, func, select
 
 from core.config import app_settings
 from core.logging_config import setup_logger
 from db.models import ElectricityPrices
 from helpers.elec_prices_helpers import (
+    HELSINKI_TZ,
+    calculate_c_per_kwh_batch,
     get_today_and_tomorrow_dates,
-    position_to_timestamp,
 )
-from models.electricity_price_models import ElectricityPriceResponse, Point
+from models.electricity_price_models import PricePoint, PriceSeries
 
 logger = setup_logger()
 
+# Built once at import; executions only bind fresh parameters.
+_TOMORROW_COUNT_STMT = (
+    select(func.count())
+    .select_from(ElectricityPrices)
+    .where(
+        ElectricityPrices.timestamp >= bindparam("start"),
+        ElectricityPrices.timestamp < bindparam("end"),
+    )
+)
+
+
+def _parse_price_series(xml_bytes: bytes) -> list[PriceSeries]:
+    """
+    Stream-parse an ENTSOE publication document into flat price series.
+
+    Only the series time-interval end and the per-point position/price leaves
+    are kept; the rest of the document is discarded as it streams past.
 
-async def get_electricity_prices(client: httpx.AsyncClient) -> ElectricityPriceResponse:
+    :param xml_bytes: Raw XML response body from the ENTSOE API
+    :type xml_bytes: bytes
+    :return: One PriceSeries per TimeSeries element in the document
+    :rtype: list[PriceSeries]
+    """
+    series_list: list[PriceSeries] = []
+    interval_end = ""
+    points: list[PricePoint] = []
+    for _, elem in iterparse(BytesIO(xml_bytes), events=("end",)):
+        tag = elem.tag.rpartition("}")[2]
+        if tag == "Point":
+            points.append(
+                PricePoint(
+                    position=int(elem.findtext("{*}position")),
+                    price_amount=float(elem.findtext("{*}price.amount")),
+                )
+            )
+        elif tag == "timeInterval":
+            # Period/timeInterval; the document-level interval has a
+            # different tag (period.timeInterval) and is skipped.
+            interval_end = elem.findtext("{*}end")
+        elif tag == "TimeSeries":
+            day = datetime.fromisoformat(interval_end.replace("Z", "+00:00")).strftime(
+                "%Y%m%d"
+            )
+            series_list.append(PriceSeries(day=day, points=points))
+            points = []
+            elem.clear()
+    return series_list
+
+
+async def get_electricity_prices(client: httpx.AsyncClient) -> list[PriceSeries]:
     """
     Fetch electricity prices from the ENTSOE API
 
     :param client: HTTPX AsyncClient for making requests
     :type client: httpx.AsyncClient
-    :return: Instance of ElectricityPriceResponse containing the electricity prices
-    :rtype: ElectricityPriceResponse
+    :return: Parsed price series for the requested period
+    :rtype: list[PriceSeries]
     """
     today, tomorrow = get_today_and_tomorrow_dates()
 
@@ -40,15 +91,10 @@ async def get_electricity_prices(client: httpx.AsyncClient) -> ElectricityPriceR
     try:
         r = await client.get(app_settings.ENTSOE_API_URL, params=payload, timeout=10.0)
 
-        xml_string = r.content.decode("utf-8")
-
-        xml_dict = xmltodict.parse(xml_string)
-
         try:
-            validated_data = ElectricityPriceResponse(**xml_dict)
-            return validated_data
+            return _parse_price_series(r.content)
         except Exception as e:
-            logger.error(f"Failed to validate electricity price data: {e}")
+            logger.error(f"Failed to parse electricity price data: {e}")
             raise
 
     except httpx.RequestError as e:
@@ -56,94 +102,109 @@ async def get_electricity_prices(client: httpx.AsyncClient) -> ElectricityPriceR
         raise
 
 
+async def fetch_and_save_electricity_prices(
+    client: httpx.AsyncClient,
+    session: Session,
+) -> list[PriceSeries]:
+    """
+    Fetch electricity prices from the ENTSOE API and persist them
+
+    Shared by the /electricity endpoint and the monitor service so the
+    fetch-then-save sequence lives in one place.
+
+    :param client: HTTPX AsyncClient for making requests
+    :type client: httpx.AsyncClient
+    :param session: Database session for saving the prices
+    :type session: Session
+    :return: Parsed price series for the requested period
+    :rtype: list[PriceSeries]
+    """
+    prices = await get_electricity_prices(client)
+    save_electricity_prices_to_db(prices, session)
+    return prices
+
+
 def save_electricity_prices_to_db(
-    prices: ElectricityPriceResponse,
+    prices: list[PriceSeries],
     session: Session,
 ) -> None:
     """
     Save electricity prices to the database
 
-    :param prices: Instance of ElectricityPriceResponse containing the electricity prices
-    :type prices: ElectricityPriceResponse
+    :param prices: Parsed price series containing the electricity prices
+    :type prices: list[PriceSeries]
     :param session: Database session for saving the prices
     :type session: Session
     """
     logger.info("Saving electricity prices to database")
 
-    document = prices.publication_market_document
-    series_list = (
-        document.time_series
-        if isinstance(document.time_series, list)
-        else [document.time_series]
-    )
-
-    new_rows_to_db: list[ElectricityPrices] = []
-
-    for series in series_list:
-        points = series.period.point
+    new_rows_to_db: list[dict] = []
+    bases: dict[str, datetime] = {}
+
+    for series in prices:
+        day = series.day
+        if not series.points:
+            continue
+        # Day parse and timezone binding done once per day (series may share
+        # one); each position is then a plain timedelta from this base.
+        base = bases.get(day)
+        if base is None:
+            base = datetime(
+                int(day[:4]), int(day[4:6]), int(day[6:8]), tzinfo=HELSINKI_TZ
+            )
+            bases[day] = base
 
-        day = datetime.fromisoformat(
-            series.period.time_interval.end.replace("Z", "+00:00")
-        ).strftime("%Y%m%d")
+        if series.points[0].position > 1:
+            logger.warning(
+                f"First position is {series.points[0].position}, expected 1. This shouldn't happen, please check the data."
+            )
 
+        # Single forward pass over the position range; gaps are filled by
+        # carrying the last valid price, with no mid-list inserts.
+        by_pos = {point.position: point.price_amount for point in series.points}
         last_valid_price_amount = None
-        i = 0
-        while i < len(points):
-            position = int(points[i].position)
-            price_amount = points[i].price_amount
-            last_position = int(points[i - 1].position) if i > 0 else None
-            if i == 0 and position > 1:
-                logger.warning(
-                    f"First position is {position}, expected 1. This shouldn't happen, please check the data."
-                )
-            if (
-                position - 1 != last_position and last_position is not None
-            ):  # if there is a gap in positions
+        for position in range(1, max(by_pos) + 1):
+            price_amount = by_pos.get(position)
+            if price_amount is None:
                 if last_valid_price_amount is None:
                     logger.warning(
-                        f"Missing position between {last_position} and {position}, and no last valid price to fill in."
-                    )
-                else:
-                    logger.info(
-                        f"Filling missing position between {last_position} and {position} with last valid price {last_valid_price_amount}."
+                        f"Missing position {position}, and no last valid price to fill in."
                     )
-                    points.insert(  # insert a new point to fill the gap
-                        i,
-                        Point(
-                            position=str(position - 1),
-                            **{"price.amount": last_valid_price_amount},
-                        ),
-                    )
-                    continue  # re-evaluate the current index after insertion
-
-            last_valid_price_amount = price_amount
-            i += 1
-
-            timestamp = position_to_timestamp(position, day)
-
-            # db transactions
-            price = session.exec(
-                select(ElectricityPrices).where(
-                    ElectricityPrices.timestamp == timestamp
+                    continue
+                logger.info(
+                    f"Filling missing position {position} with last valid price {last_valid_price_amount}."
                 )
-            ).first()
-            if price:
-                continue  # skip existing records
+                price_amount = last_valid_price_amount
+            else:
+                last_valid_price_amount = price_amount
+
+            timestamp = base + timedelta(minutes=60 + (position - 1) * 15)
 
             new_rows_to_db.append(
-                ElectricityPrices(
-                    timestamp=timestamp,
-                    price_amount_mwh_eur=price_amount,
-                )
+                {
+                    "timestamp": timestamp,
+                    "price_amount_mwh_eur": price_amount,
+                }
             )
 
     if new_rows_to_db:
+        # VAT-inclusive values precomputed for the whole batch in one pass,
+        # so reads return them as-is.
+        vat_prices = calculate_c_per_kwh_batch(
+            [row["price_amount_mwh_eur"] for row in new_rows_to_db]
+        )
+        for row, price_c in zip(new_rows_to_db, vat_prices):
+            row["price_c_kwh_vat"] = round(price_c, 2)
         try:
-            session.add_all(new_rows_to_db)
-            session.commit()
-            logger.info(
-                f"Inserted {len(new_rows_to_db)} new electricity price records."
+            # One multi-row INSERT with DB-side dedup on the primary key;
+            # no existence prefetch and no per-row ORM flushes.
+            result = session.execute(
+                pg_insert(ElectricityPrices)
+                .values(new_rows_to_db)
+                .on_conflict_do_nothing(index_elements=["timestamp"])
             )
+            session.commit()
+            logger.info(f"Inserted {result.rowcount} new electricity price records.")
         except Exception as e:
             session.rollback()
             raise e
@@ -163,21 +224,21 @@ def check_if_tomorrow_prices_exist(
     :rtype: bool
     """
     _, tomorrow = get_today_and_tomorrow_dates()
-    tomorrow_date = datetime.strptime(tomorrow, "%Y%m%d").replace(
-        tzinfo=ZoneInfo("Europe/Helsinki")
-    )
+    tomorrow_date = datetime.strptime(tomorrow, "%Y%m%d").replace(tzinfo=HELSINKI_TZ)
     try:
         count = session.exec(
-            select(func.count())
-            .select_from(ElectricityPrices)
-            .where(
-                ElectricityPrices.timestamp >= tomorrow_date,
-                ElectricityPrices.timestamp < tomorrow_date.replace(hour=23, minute=59),
-            )
+            _TOMORROW_COUNT_STMT,
+            params={
+                "start": tomorrow_date,
+                "end": tomorrow_date.replace(hour=23, minute=59),
+            },
         ).one()
+        # End the read transaction; the monitor's long-lived session must
+        # not be left idle-in-transaction when no save follows.
+        session.rollback()
     except Exception as e:
         logger.error(f"Failed to check for tomorrow's prices: {e}")
         return False
 
-    logger.debug(f"Tomorrow prices count: {count}")
+    logger.debug("Tomorrow prices count: %s", count)
     return count >= 96  # Assuming 96 quarter-hourly prices for tomorrow
@@ -0,0 +1,16 @@
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Make both the repo root (for `src.`-prefixed imports) and src itself (for
+# the app's own absolute imports) importable, matching how the app runs.
+for _path in (str(ROOT), str(ROOT / "src")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+# Settings fall back to the template values when no real .env is present;
+# already-set environment variables take precedence.
+load_dotenv(ROOT / ".env.example")
@@ -1,22 +1,16 @@
 # tests/unit/helpers/test_elec_prices_helpers.py
-from datetime import datetime, timezone
+from datetime import datetime
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from src.helpers import elec_prices_helpers as helpers
 
+DAY = "20230915"
 
-class FrozenDatetime(datetime):
-    @classmethod
-    def now(cls, tz=None):
-        base = datetime(2023, 9, 15, tzinfo=ZoneInfo("Europe/Helsinki"))
-        return base.astimezone(tz) if tz else base
 
-
-def test_position_one_starts_at_second_hour(monkeypatch):
-    monkeypatch.setattr(helpers, "datetime", FrozenDatetime)
-    result = helpers.position_to_timestamp(1)
+def test_position_one_starts_at_second_hour():
+    result = helpers.position_to_timestamp(1, DAY)
     assert result == datetime(2023, 9, 15, 1, 0, tzinfo=ZoneInfo("Europe/Helsinki"))
 
 
@@ -24,10 +18,20 @@ def test_position_one_starts_at_second_hour(monkeypatch):
     "position,expected",
     [
         (4, datetime(2023, 9, 15, 1, 45, tzinfo=ZoneInfo("Europe/Helsinki"))),
-        (92, datetime(2023, 9, 15, 22, 45, tzinfo=ZoneInfo("Europe/Helsinki"))),
+        (92, datetime(2023, 9, 15, 23, 45, tzinfo=ZoneInfo("Europe/Helsinki"))),
         (93, datetime(2023, 9, 16, 0, 0, tzinfo=ZoneInfo("Europe/Helsinki"))),
     ],
 )
-def test_position_to_timestamp_conversion(monkeypatch, position, expected):
-    monkeypatch.setattr(helpers, "datetime", FrozenDatetime)
-    assert helpers.position_to_timestamp(position) == expected
+def test_position_to_timestamp_conversion(position, expected):
+    assert helpers.position_to_timestamp(position, DAY) == expected
+
+
+def test_calculate_c_per_kwh_batch_matches_scalar():
+    prices = [0.0, 1.0, 100.0, -5.0]
+    assert helpers.calculate_c_per_kwh_batch(prices) == [
+        helpers.calculate_c_per_kwh(price) for price in prices
+    ]
+
+
+def test_calculate_c_per_kwh_batch_empty():
+    assert helpers.calculate_c_per_kwh_batch([]) == []
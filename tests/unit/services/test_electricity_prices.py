@@ -0,0 +1,130 @@
+# tests/unit/services/test_electricity_prices.py
+from datetime import datetime
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from db.models import ElectricityPrices
+from helpers.elec_prices_helpers import calculate_c_per_kwh
+from models.electricity_price_models import PricePoint, PriceSeries
+from services.electricity_prices import (
+    _parse_price_series,
+    save_electricity_prices_to_db,
+)
+
+_NS = "urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:3"
+
+
+def _series_xml(interval_end: str, points: list[tuple[int, str]]) -> str:
+    points_xml = "".join(
+        f"<Point><position>{position}</position>"
+        f"<price.amount>{amount}</price.amount></Point>"
+        for position, amount in points
+    )
+    return (
+        "<TimeSeries><Period>"
+        f"<timeInterval><start>ignored</start><end>{interval_end}</end></timeInterval>"
+        f"<resolution>PT15M</resolution>{points_xml}"
+        "</Period></TimeSeries>"
+    )
+
+
+def _document_xml(*series: str) -> bytes:
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<Publication_MarketDocument xmlns="{_NS}">'
+        "<period.timeInterval>"
+        "<start>2023-09-13T22:00Z</start><end>2023-09-15T22:00Z</end>"
+        "</period.timeInterval>"
+        f'{"".join(series)}'
+        "</Publication_MarketDocument>"
+    ).encode()
+
+
+@pytest.fixture()
+def session():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def test_parse_price_series_multi_series():
+    doc = _document_xml(
+        _series_xml("2023-09-14T22:00Z", [(1, "10.5"), (2, "20.0")]),
+        _series_xml("2023-09-15T22:00Z", [(1, "30.0")]),
+    )
+    series = _parse_price_series(doc)
+    assert [s.day for s in series] == ["20230914", "20230915"]
+    assert series[0].points == [
+        PricePoint(position=1, price_amount=10.5),
+        PricePoint(position=2, price_amount=20.0),
+    ]
+    assert series[1].points == [PricePoint(position=1, price_amount=30.0)]
+
+
+def test_parse_price_series_skips_document_interval():
+    # The series day must come from the TimeSeries interval end, not the
+    # document-level period.timeInterval (which ends a day later).
+    doc = _document_xml(_series_xml("2023-09-14T22:00Z", [(1, "1.0")]))
+    (series,) = _parse_price_series(doc)
+    assert series.day == "20230914"
+
+
+def test_parse_price_series_missing_price_leaf_raises():
+    broken = _document_xml(
+        "<TimeSeries><Period>"
+        "<timeInterval><start>x</start><end>2023-09-14T22:00Z</end></timeInterval>"
+        "<Point><position>1</position></Point>"
+        "</Period></TimeSeries>"
+    )
+    with pytest.raises((TypeError, ValueError)):
+        _parse_price_series(broken)
+
+
+def test_save_fills_gaps_in_single_pass(session):
+    points = [
+        PricePoint(position=position, price_amount=amount)
+        for position, amount in ((1, 10.0), (2, 20.0), (5, 50.0))
+    ]
+    series = [PriceSeries(day="20230915", points=points)]
+    save_electricity_prices_to_db(series, session)
+
+    rows = session.exec(
+        select(ElectricityPrices).order_by(ElectricityPrices.timestamp)
+    ).all()
+    assert [row.price_amount_mwh_eur for row in rows] == [10.0, 20.0, 20.0, 20.0, 50.0]
+    # Position 1 starts at 01:00 local on the series day.
+    assert rows[0].timestamp == datetime(2023, 9, 15, 1, 0)
+    assert rows[0].price_c_kwh_vat == round(calculate_c_per_kwh(10.0), 2)
+    # Gap filling must not mutate the parsed input series.
+    assert len(points) == 3
+
+
+def test_save_skips_leading_gap_without_fill_price(session):
+    points = [
+        PricePoint(position=position, price_amount=amount)
+        for position, amount in ((2, 20.0), (4, 40.0))
+    ]
+    save_electricity_prices_to_db([PriceSeries(day="20230915", points=points)], session)
+    rows = session.exec(
+        select(ElectricityPrices).order_by(ElectricityPrices.timestamp)
+    ).all()
+    # Position 1 has no earlier price to carry; positions 2-4 are stored
+    # with the gap at 3 filled from position 2.
+    assert [row.price_amount_mwh_eur for row in rows] == [20.0, 20.0, 40.0]
+
+
+def test_save_is_idempotent(session):
+    series = [
+        PriceSeries(
+            day="20230915",
+            points=[
+                PricePoint(position=p, price_amount=float(p)) for p in range(1, 97)
+            ],
+        )
+    ]
+    save_electricity_prices_to_db(series, session)
+    save_electricity_prices_to_db(series, session)
+    count = len(session.exec(select(ElectricityPrices)).all())
+    assert count == 96